@@ -2,32 +2,60 @@
 """Live logger for Eufy RoboVac status updates."""
 from __future__ import annotations
 
+import argparse
 import asyncio
 import getpass
+import hashlib
 import json
 import logging
+import os
+import signal
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 # Make the vendored robovac component importable when running the script from
 # this repository without requiring installation as a package.
 REPO_ROOT = Path(__file__).resolve().parent
 ROBOVAC_VENDOR_PATH = REPO_ROOT / "vendor" / "robovac"
+
+
+def _precompile_vendor(vendor_path: Path) -> None:
+    """Byte-compile the vendored component once so later runs skip parsing.
+
+    Guarded by a marker file; failures (e.g. a read-only checkout) are
+    harmless and simply leave compilation to the import machinery.
+    """
+    marker = vendor_path / ".precompiled"
+    if marker.exists():
+        return
+    import compileall
+
+    try:
+        compileall.compile_dir(str(vendor_path / "custom_components"), quiet=2)
+        marker.touch()
+    except OSError:
+        pass
+
+
 if ROBOVAC_VENDOR_PATH.exists():
     sys.path.insert(0, str(ROBOVAC_VENDOR_PATH))
+    _precompile_vendor(ROBOVAC_VENDOR_PATH)
 
 # pylint: disable=wrong-import-position
+# EufyLogon, TuyaAPISession, and the countries helpers are imported lazily in
+# the auth path so warm-cache runs never pay for them (or their transitive
+# requests/jwt imports).
 from custom_components.robovac.const import PING_RATE, TIMEOUT  # type: ignore[attr-defined]
-from custom_components.robovac.countries import (  # type: ignore[attr-defined]
-    get_phone_code_by_country_code,
-    get_phone_code_by_region,
-    get_region_by_country_code,
-    get_region_by_phone_code,
-)
-from custom_components.robovac.eufywebapi import EufyLogon  # type: ignore[attr-defined]
 from custom_components.robovac.robovac import (  # type: ignore[attr-defined]
+    SUPPORTED_MODELS,
     ModelNotSupportedException,
     RoboVac,
 )
@@ -35,42 +63,129 @@ from custom_components.robovac.tuyalocaldiscovery import (  # type: ignore[attr-
     DiscoveryPortsNotAvailableException,
     TuyaLocalDiscovery,
 )
-from custom_components.robovac.tuyawebapi import TuyaAPISession  # type: ignore[attr-defined]
 
 _LOGGER = logging.getLogger("robovac_logger")
 
 
-class VacuumLoginError(RuntimeError):
-    """Raised when the script cannot log in or locate a vacuum."""
+@lru_cache(maxsize=None)
+def _country_lookups() -> tuple:
+    """Import the country-table helpers on first use and memoize them.
 
+    The table is immutable, so each helper is wrapped in an lru_cache turning
+    repeated lookups into O(1) hits instead of table scans.
+    """
+    from custom_components.robovac.countries import (  # type: ignore[attr-defined]
+        get_phone_code_by_country_code,
+        get_phone_code_by_region,
+        get_region_by_country_code,
+        get_region_by_phone_code,
+    )
 
-def _fetch_first_vacuum_sync(email: str, password: str) -> Dict[str, Any]:
-    """Blocking helper that authenticates with Eufy and Tuya."""
-    eufy_session = EufyLogon(email, password)
-    user_response = eufy_session.get_user_info()
-    if user_response is None or user_response.status_code != 200:
-        raise VacuumLoginError("Failed to reach the Eufy API. Check your credentials or network.")
+    return tuple(
+        lru_cache(maxsize=None)(helper)
+        for helper in (
+            get_phone_code_by_country_code,
+            get_phone_code_by_region,
+            get_region_by_country_code,
+            get_region_by_phone_code,
+        )
+    )
 
-    user_data = user_response.json()
-    if user_data.get("res_code") != 1:
-        raise VacuumLoginError("Authentication with the Eufy API was rejected.")
+# Sentinel distinguishing "key absent" from "key set to None" when diffing state.
+_MISSING = object()
 
-    user_info = user_data["user_info"]
-    access_token = user_data["access_token"]
+# Only flush per event when a human is watching; when piped, let the OS buffer.
+_STDOUT_IS_TTY = sys.stdout.isatty()
 
-    device_response = eufy_session.get_device_info(
-        user_info["request_host"], user_info["id"], access_token
-    )
-    if device_response is None:
-        raise VacuumLoginError("Unable to retrieve the device list from Eufy.")
-    device_data = device_response.json()
+# Successful logins are cached on disk so warm starts skip the three Eufy/Tuya
+# round trips entirely. Entries older than the TTL are re-authenticated.
+CACHE_DIR = Path.home() / ".cache" / "robovac_logger"
+CACHE_TTL_SECONDS = 24 * 60 * 60
 
-    settings_response = eufy_session.get_user_settings(
-        user_info["request_host"], user_info["id"], access_token
-    )
-    if settings_response is None:
-        raise VacuumLoginError("Unable to retrieve the user settings from Eufy.")
-    settings_data = settings_response.json()
+
+def _cache_path(email: str) -> Path:
+    """Return the cache file for an account, keyed by a hash of the email."""
+    digest = hashlib.sha256(email.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _load_cached_vacuum(email: str) -> Optional[Dict[str, Any]]:
+    """Return the cached vacuum descriptor for this account, or None."""
+    try:
+        with open(_cache_path(email), encoding="utf-8") as cache_file:
+            entry = json.load(cache_file)
+        if time.time() - entry["timestamp"] > CACHE_TTL_SECONDS:
+            return None
+        return entry["vacuum"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _invalidate_cached_vacuum(email: str) -> None:
+    """Remove a stale cache entry so the next login is a live one."""
+    try:
+        _cache_path(email).unlink(missing_ok=True)
+    except OSError as err:
+        _LOGGER.debug("Could not remove the login cache: %s", err)
+
+
+def _store_cached_vacuum(email: str, vacuum_details: Dict[str, Any]) -> None:
+    """Atomically persist a vacuum descriptor; failures are non-fatal."""
+    cache_path = _cache_path(email)
+    entry = {"timestamp": time.time(), "vacuum": vacuum_details}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError as err:
+        _LOGGER.debug("Could not write the login cache: %s", err)
+
+
+def _dump_changes(changes: Dict[str, Any]) -> str:
+    """Serialize a changes dict, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            changes, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    return json.dumps(changes, indent=2, sort_keys=True)
+
+
+def _parse_response(response: Any) -> Any:
+    """Decode a requests.Response body, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dump_event(timestamp: str, changes: Dict[str, Any]) -> str:
+    """Serialize one update as a single-line NDJSON record."""
+    record = {"ts": timestamp, "changes": changes}
+    if orjson is not None:
+        return orjson.dumps(record).decode() + "\n"
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+class VacuumLoginError(RuntimeError):
+    """Raised when the script cannot log in or locate a vacuum."""
+
+
+def _select_first_vacuum_sync(
+    user_info: Dict[str, Any],
+    device_data: Dict[str, Any],
+    settings_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Blocking helper that resolves the Tuya session and picks a vacuum."""
+    from custom_components.robovac.tuyawebapi import TuyaAPISession  # type: ignore[attr-defined]
+
+    (
+        get_phone_code_by_country_code,
+        get_phone_code_by_region,
+        get_region_by_country_code,
+        get_region_by_phone_code,
+    ) = _country_lookups()
 
     region: str
     country_code: str
@@ -101,27 +216,54 @@ def _fetch_first_vacuum_sync(email: str, password: str) -> Dict[str, Any]:
     )
 
     devices = device_data.get("devices", [])
-    for item in devices:
-        product = item.get("product", {})
-        if product.get("appliance") != "Cleaning":
-            continue
+    # Filter before touching the Tuya API: every get_device call is a full
+    # HTTPS round trip, so non-cleaning appliances should never reach it.
+    cleaning = [
+        item for item in devices if (item.get("product") or {}).get("appliance") == "Cleaning"
+    ]
+
+    pinned_id = os.environ.get("ROBOVAC_DEVICE_ID")
+    if pinned_id:
+        cleaning = [item for item in cleaning if item.get("id") == pinned_id]
+        if not cleaning:
+            raise VacuumLoginError(
+                f"No cleaning device with id {pinned_id} (from ROBOVAC_DEVICE_ID) "
+                "was found on this Eufy account."
+            )
+
+    skipped = 0
+    for item in cleaning:
+        # Bind the repeatedly accessed fields once per device.
+        product = item.get("product") or {}
+        item_id = item.get("id")
+        item_name = item.get("name")
 
         try:
-            tuya_device = tuya_client.get_device(item["id"])
+            tuya_device = tuya_client.get_device(item_id)
         except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.debug("Skipping device %s due to Tuya API error: %s", item.get("id"), err)
+            _LOGGER.debug("Skipping device %s due to Tuya API error: %s", item_id, err)
+            skipped += 1
             continue
 
         access_token = tuya_device.get("localKey")
         if not access_token:
-            _LOGGER.debug("Device %s does not provide a local key", item.get("id"))
+            _LOGGER.debug("Device %s does not provide a local key", item_id)
+            skipped += 1
             continue
 
+        if skipped:
+            _LOGGER.warning(
+                "Paid %d extra Tuya round trip(s) before finding %s; "
+                "set ROBOVAC_DEVICE_ID=%s to skip them on the next run.",
+                skipped,
+                item_id,
+                item_id,
+            )
         return {
-            "id": item["id"],
-            "name": item.get("alias_name") or item.get("name") or "RoboVac",
+            "id": item_id,
+            "name": item.get("alias_name") or item_name or "RoboVac",
             "model": product.get("product_code", ""),
-            "description": item.get("name", "Eufy RoboVac"),
+            "description": item_name or "Eufy RoboVac",
             "mac": item.get("wifi", {}).get("mac"),
             "access_token": access_token,
         }
@@ -130,41 +272,111 @@ def _fetch_first_vacuum_sync(email: str, password: str) -> Dict[str, Any]:
 
 
 async def fetch_first_vacuum(email: str, password: str) -> Dict[str, Any]:
-    """Authenticate with the APIs using a background thread."""
-    return await asyncio.to_thread(_fetch_first_vacuum_sync, email, password)
+    """Authenticate with the APIs, overlapping the independent Eufy calls."""
+    from custom_components.robovac.eufywebapi import EufyLogon  # type: ignore[attr-defined]
 
+    eufy_session = EufyLogon(email, password)
+    user_response = await asyncio.to_thread(eufy_session.get_user_info)
+    if user_response is None or user_response.status_code != 200:
+        raise VacuumLoginError("Failed to reach the Eufy API. Check your credentials or network.")
+
+    user_data = _parse_response(user_response)
+    if user_data.get("res_code") != 1:
+        raise VacuumLoginError("Authentication with the Eufy API was rejected.")
 
-async def discover_device_ip(device_id: str, timeout: float = 60.0) -> str:
-    """Listen for Tuya LAN broadcasts to determine the device's IP address."""
+    user_info = user_data["user_info"]
+    access_token = user_data["access_token"]
+
+    # The device list and user settings only depend on the login response, so
+    # fetch them concurrently and pay the cloud round trip once.
+    device_response, settings_response = await asyncio.gather(
+        asyncio.to_thread(
+            eufy_session.get_device_info, user_info["request_host"], user_info["id"], access_token
+        ),
+        asyncio.to_thread(
+            eufy_session.get_user_settings, user_info["request_host"], user_info["id"], access_token
+        ),
+    )
+    if device_response is None:
+        raise VacuumLoginError("Unable to retrieve the device list from Eufy.")
+    if settings_response is None:
+        raise VacuumLoginError("Unable to retrieve the user settings from Eufy.")
+
+    vacuum_details = await asyncio.to_thread(
+        _select_first_vacuum_sync,
+        user_info,
+        _parse_response(device_response),
+        _parse_response(settings_response),
+    )
+    _store_cached_vacuum(email, vacuum_details)
+    return vacuum_details
+
+
+async def _probe_cached_ip(cached_ip: str, ip_future: "asyncio.Future[str]") -> None:
+    """Check whether the vacuum still answers on its last-known address."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(cached_ip, 6668), timeout=1.0
+        )
+    except (OSError, asyncio.TimeoutError):
+        return
+    writer.close()
+    if not ip_future.done():
+        _LOGGER.info("Vacuum still responds at the cached address %s", cached_ip)
+        ip_future.set_result(cached_ip)
+
+
+async def discover_device_ip(
+    device_id: str, timeout: float = 8.0, cached_ip: Optional[str] = None
+) -> str:
+    """Listen for Tuya LAN broadcasts to determine the device's IP address.
+
+    Devices beacon every few seconds, so the default timeout covers several
+    broadcast intervals. When a last-known address is supplied, it is probed
+    concurrently with the broadcast listener so a stable LAN resolves in
+    milliseconds instead of waiting for the next beacon.
+    """
     loop = asyncio.get_running_loop()
     ip_future: asyncio.Future[str] = loop.create_future()
 
-    async def handle_discovery(payload: Dict[str, Any]) -> None:
-        if payload.get("gwId") != device_id:
-            return
-        ip_address = payload.get("ip")
-        if ip_address and not ip_future.done():
-            _LOGGER.info("Discovered %s at %s", device_id, ip_address)
-            ip_future.set_result(ip_address)
-
-    discovery = TuyaLocalDiscovery(handle_discovery)
     try:
-        await discovery.start()
+        # The context manager pairs socket setup and teardown, so the UDP
+        # listeners are closed deterministically even on cancellation.
+        async with TuyaLocalDiscovery() as discovery:
+
+            async def watch_broadcasts() -> None:
+                # Packets are queued synchronously by the protocol, so the
+                # first matching beacon resolves the future on the very next
+                # loop step.
+                async for payload in discovery:
+                    if payload.get("gwId") != device_id:
+                        continue
+                    ip_address = payload.get("ip")
+                    if ip_address and not ip_future.done():
+                        _LOGGER.info("Discovered %s at %s", device_id, ip_address)
+                        ip_future.set_result(ip_address)
+                        return
+
+            watch_task = asyncio.create_task(watch_broadcasts())
+            probe_task: Optional[asyncio.Task[None]] = None
+            if cached_ip:
+                probe_task = asyncio.create_task(_probe_cached_ip(cached_ip, ip_future))
+
+            try:
+                return await asyncio.wait_for(ip_future, timeout=timeout)
+            except asyncio.TimeoutError as err:
+                raise VacuumLoginError(
+                    "Timed out waiting for the vacuum to announce itself on the local network."
+                ) from err
+            finally:
+                watch_task.cancel()
+                if probe_task is not None:
+                    probe_task.cancel()
     except DiscoveryPortsNotAvailableException as err:
-        discovery.close()
         raise VacuumLoginError(str(err)) from err
 
-    try:
-        return await asyncio.wait_for(ip_future, timeout=timeout)
-    except asyncio.TimeoutError as err:
-        raise VacuumLoginError(
-            "Timed out waiting for the vacuum to announce itself on the local network."
-        ) from err
-    finally:
-        discovery.close()
 
-
-async def main() -> None:
+async def main(pretty: bool = False) -> None:
     """Prompt for credentials, connect to the vacuum, and log updates."""
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
 
@@ -174,73 +386,196 @@ async def main() -> None:
     if not email or not password:
         raise SystemExit("Both email and password are required.")
 
-    _LOGGER.info("Logging in to the Eufy and Tuya services...")
-    vacuum_details = await fetch_first_vacuum(email, password)
+    cached_details = _load_cached_vacuum(email)
+    pinned_id = os.environ.get("ROBOVAC_DEVICE_ID")
+    if cached_details is not None and pinned_id and cached_details.get("id") != pinned_id:
+        # The cache holds a different device than the pin asks for; a live
+        # login lets the selection honor ROBOVAC_DEVICE_ID (and overwrites
+        # the cache with the pinned device on success).
+        _LOGGER.info(
+            "Cached vacuum %s does not match ROBOVAC_DEVICE_ID=%s; logging in afresh.",
+            cached_details.get("id"),
+            pinned_id,
+        )
+        cached_details = None
+    from_cache = cached_details is not None
+    if from_cache:
+        _LOGGER.info("Using the cached vacuum details from a previous login.")
+        vacuum_details = cached_details
+    else:
+        _LOGGER.info("Logging in to the Eufy and Tuya services...")
+        vacuum_details = await fetch_first_vacuum(email, password)
     _LOGGER.info("Found RoboVac '%s' (model %s)", vacuum_details["name"], vacuum_details["model"])
 
-    _LOGGER.info("Waiting for the vacuum to broadcast its IP address...")
-    ip_address = await discover_device_ip(vacuum_details["id"])
-    vacuum_details["ip_address"] = ip_address
+    loop = asyncio.get_running_loop()
 
     previous_state: Dict[str, Any] = {}
+    last_signature: Optional[int] = None
+    # Bursts of DPS updates within the debounce window are coalesced into a
+    # single printed record instead of one JSON encode per update.
+    pending_changes: Dict[str, Any] = {}
+    flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def flush_pending() -> None:
+        nonlocal flush_handle
+        flush_handle = None
+        if not pending_changes:
+            return
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        # One write per event instead of several line-buffered print calls.
+        if pretty:
+            sys.stdout.write(
+                f"\n[{timestamp}] Received vacuum update:\n{_dump_changes(pending_changes)}\n\n"
+            )
+        else:
+            sys.stdout.write(_dump_event(timestamp, pending_changes))
+        if _STDOUT_IS_TTY:
+            sys.stdout.flush()
+        pending_changes.clear()
 
     async def log_state_update() -> None:
-        nonlocal previous_state
+        nonlocal flush_handle, last_signature
         if vacuum is None:
             return
         current_state = vacuum.state
         if not current_state:
             return
-        changes = {
-            key: current_state[key]
-            for key in current_state
-            if previous_state.get(key) != current_state[key]
-        }
-        previous_state = dict(current_state)
+        # Tuya resends the full state on every ping; a cheap hash of the
+        # items lets identical snapshots return before any diffing. Fall
+        # back to the full diff when a value is unhashable.
+        try:
+            signature: Optional[int] = hash(tuple(sorted(current_state.items())))
+        except TypeError:
+            signature = None
+        if signature is not None and signature == last_signature:
+            return
+        last_signature = signature
+        # Diff incrementally instead of snapshotting the whole dict each tick:
+        # compare identities first (cheap for unchanged values), fall back to
+        # equality, and mutate previous_state in place for the next call.
+        changes: Dict[str, Any] = {}
+        for key, value in current_state.items():
+            previous_value = previous_state.get(key, _MISSING)
+            if previous_value is value or previous_value == value:
+                continue
+            changes[key] = value
+            previous_state[key] = value
         if not changes:
             return
-        timestamp = datetime.now().isoformat(timespec="seconds")
-        print(f"\n[{timestamp}] Received vacuum update:")
-        print(json.dumps(changes, indent=2, sort_keys=True))
-        print()
-
-    model_code = (vacuum_details.get("model") or "")[:5]
-    if not model_code:
-        raise VacuumLoginError("The vacuum did not report a model code.")
+        pending_changes.update(changes)
+        if flush_handle is None:
+            flush_handle = loop.call_later(0.05, flush_pending)
 
     vacuum: Optional[RoboVac] = None
-    try:
-        vacuum = RoboVac(
-            model_code=model_code,
-            device_id=vacuum_details["id"],
-            host=vacuum_details["ip_address"],
-            local_key=vacuum_details["access_token"],
-            timeout=TIMEOUT,
-            ping_interval=PING_RATE,
-            update_entity_state=log_state_update,
+
+    async def connect_vacuum(details: Dict[str, Any]) -> None:
+        """Discover the vacuum's address, build the client, and connect."""
+        nonlocal vacuum
+
+        _LOGGER.info("Waiting for the vacuum to broadcast its IP address...")
+        ip_address = await discover_device_ip(
+            details["id"], cached_ip=details.get("ip_address")
         )
-    except ModelNotSupportedException as err:
-        raise VacuumLoginError(f"Model {model_code} is not supported by the RoboVac integration.") from err
+        details["ip_address"] = ip_address
+        # Remember the address so the next run can probe it instead of
+        # waiting for a broadcast.
+        _store_cached_vacuum(email, details)
+
+        model_code = (details.get("model") or "")[:5]
+        if not model_code:
+            raise VacuumLoginError("The vacuum did not report a model code.")
+        # Validate against the supported set before the constructor sets up
+        # any connection state only to tear it down again.
+        if model_code not in SUPPORTED_MODELS:
+            raise VacuumLoginError(
+                f"Model {model_code} is not supported by the RoboVac integration."
+            )
+
+        try:
+            vacuum = RoboVac(
+                model_code=model_code,
+                device_id=details["id"],
+                host=details["ip_address"],
+                local_key=details["access_token"],
+                timeout=TIMEOUT,
+                ping_interval=PING_RATE,
+                update_entity_state=log_state_update,
+            )
+        except ModelNotSupportedException as err:
+            raise VacuumLoginError(
+                f"Model {model_code} is not supported by the RoboVac integration."
+            ) from err
+
+        try:
+            await vacuum.async_connect()
+        except Exception as err:  # pylint: disable=broad-except
+            try:
+                await vacuum.async_disconnect()
+            except Exception:  # pylint: disable=broad-except
+                pass
+            vacuum = None
+            raise VacuumLoginError(
+                f"Could not connect to the vacuum at {ip_address}: {err}"
+            ) from err
+
+    try:
+        await connect_vacuum(vacuum_details)
+    except VacuumLoginError as err:
+        if not from_cache:
+            raise
+        # The cached descriptor may be stale — for example the vacuum was
+        # re-paired and its local key rotated. Drop the entry and retry with
+        # a live login before giving up.
+        _LOGGER.warning("The cached vacuum details failed (%s); re-authenticating.", err)
+        _invalidate_cached_vacuum(email)
+        _LOGGER.info("Logging in to the Eufy and Tuya services...")
+        vacuum_details = await fetch_first_vacuum(email, password)
+        await connect_vacuum(vacuum_details)
+
+    # Sleep indefinitely between vacuum pushes instead of waking the event
+    # loop once a second; the event is only set when a shutdown signal lands.
+    stop = asyncio.Event()
+    signals_installed = []
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # add_signal_handler is unavailable on non-POSIX platforms; fall
+            # back to the KeyboardInterrupt raised by the default handler.
+            break
+        signals_installed.append(signum)
 
     try:
-        await vacuum.async_connect()
         await vacuum.async_get()
         await log_state_update()
         print(
             "Listening for vacuum status changes... Go to your Eufy app and start a room "
             "clean to see the logs. Press Ctrl+C to exit."
         )
-        while True:
-            await asyncio.sleep(1)
+        await stop.wait()
+        print("\nDisconnecting from the vacuum...")
     except KeyboardInterrupt:
         print("\nDisconnecting from the vacuum...")
     finally:
+        # Drain anything still waiting in the debounce window.
+        if flush_handle is not None:
+            flush_handle.cancel()
+        flush_pending()
+        for signum in signals_installed:
+            loop.remove_signal_handler(signum)
         await vacuum.async_disconnect()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="print indented multi-line updates instead of single-line NDJSON",
+    )
+    args = parser.parse_args()
     try:
-        asyncio.run(main())
+        asyncio.run(main(pretty=args.pretty))
     except VacuumLoginError as err:
         _LOGGER.error("%s", err)
         raise SystemExit(1) from err